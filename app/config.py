@@ -1,19 +1,67 @@
+import functools
 import os
+from dataclasses import dataclass
 
-# Elasticsearch Configuration
-ELASTICSEARCH_PROTOCOL = os.getenv("ELASTICSEARCH_PROTOCOL", "http")
-ELASTICSEARCH_HOST = os.getenv("ELASTICSEARCH_HOST", "localhost")
-ELASTICSEARCH_PORT = int(os.getenv("ELASTICSEARCH_PORT", 9200))
-ELASTICSEARCH_INDEX = os.getenv("ELASTICSEARCH_INDEX", "newsgroups")
 
-# Logging Configuration
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+@functools.lru_cache(maxsize=None)
+def _env(key, default, cast=str):
+    """Read an environment variable once per process, with casting."""
+    return cast(os.environ.get(key, default))
 
-# Data Loading Configuration
-DEFAULT_MAX_DOCUMENTS = int(os.getenv("DEFAULT_MAX_DOCUMENTS", 1000))
-DEFAULT_SUBSET = os.getenv("DEFAULT_SUBSET", "train")
 
-# API Configuration
-MAX_BULK_SIZE = int(os.getenv("MAX_BULK_SIZE", 1000))
-DEFAULT_SEARCH_LIMIT = int(os.getenv("DEFAULT_SEARCH_LIMIT", 10))
-MAX_SEARCH_LIMIT = int(os.getenv("MAX_SEARCH_LIMIT", 100))
\ No newline at end of file
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Immutable application settings, built once per process."""
+
+    # Elasticsearch Configuration
+    elasticsearch_protocol: str
+    elasticsearch_host: str
+    elasticsearch_port: int
+    elasticsearch_index: str
+
+    # Logging Configuration
+    log_level: str
+
+    # Data Loading Configuration
+    default_max_documents: int
+    default_subset: str
+
+    # API Configuration
+    max_bulk_size: int
+    default_search_limit: int
+    max_search_limit: int
+
+
+@functools.lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance (parsed exactly once)."""
+    return Settings(
+        elasticsearch_protocol=_env("ELASTICSEARCH_PROTOCOL", "http"),
+        elasticsearch_host=_env("ELASTICSEARCH_HOST", "localhost"),
+        elasticsearch_port=_env("ELASTICSEARCH_PORT", 9200, int),
+        elasticsearch_index=_env("ELASTICSEARCH_INDEX", "newsgroups"),
+        log_level=_env("LOG_LEVEL", "INFO"),
+        default_max_documents=_env("DEFAULT_MAX_DOCUMENTS", 1000, int),
+        default_subset=_env("DEFAULT_SUBSET", "train"),
+        max_bulk_size=_env("MAX_BULK_SIZE", 1000, int),
+        default_search_limit=_env("DEFAULT_SEARCH_LIMIT", 10, int),
+        max_search_limit=_env("MAX_SEARCH_LIMIT", 100, int),
+    )
+
+
+# Module-level aliases kept for existing `from app import config` callers.
+_settings = get_settings()
+
+ELASTICSEARCH_PROTOCOL = _settings.elasticsearch_protocol
+ELASTICSEARCH_HOST = _settings.elasticsearch_host
+ELASTICSEARCH_PORT = _settings.elasticsearch_port
+ELASTICSEARCH_INDEX = _settings.elasticsearch_index
+
+LOG_LEVEL = _settings.log_level
+
+DEFAULT_MAX_DOCUMENTS = _settings.default_max_documents
+DEFAULT_SUBSET = _settings.default_subset
+
+MAX_BULK_SIZE = _settings.max_bulk_size
+DEFAULT_SEARCH_LIMIT = _settings.default_search_limit
+MAX_SEARCH_LIMIT = _settings.max_search_limit
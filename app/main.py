@@ -2,7 +2,11 @@ import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from elasticsearch import Elasticsearch
+from fastapi.responses import ORJSONResponse
+from elastic_transport import OrjsonSerializer
+from elasticsearch import AsyncElasticsearch
+
+from pydantic import TypeAdapter
 
 from app import config, dependencies
 from app.services.elasticsearch_service import ElasticsearchService
@@ -10,53 +14,95 @@ from app.services.data_loader import NewsDataLoader
 from app.models import DocumentCreate
 from app.routers import documents, search, data, analytics
 
+# Validates the sample batch in one pydantic-core pass
+_DOCUMENT_LIST_ADAPTER = TypeAdapter(list[DocumentCreate])
+
+# Skip populating record fields our format string never uses
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 logging.basicConfig(
     level=getattr(logging, config.LOG_LEVEL, logging.INFO),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
 )
 
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):
-    logger.info("Starting application lifespan startup")
+async def es_lifespan(app: FastAPI):
+    """Bring up the Elasticsearch client/service; always close the client."""
+    # Bind settings once; slot reads beat repeated module-attr lookups
+    settings = config.get_settings()
+
+    es_url = f"{settings.elasticsearch_protocol}://{settings.elasticsearch_host}:{settings.elasticsearch_port}/"
+    logger.info("Initializing Elasticsearch client with URL: %s", es_url)
+    es_client = AsyncElasticsearch(
+        es_url,
+        http_compress=True,
+        request_timeout=30,
+        retry_on_timeout=True,
+        # The default pool of 10 connections per node serializes request
+        # bursts; size it for the single-node setup this app targets
+        connections_per_node=20,
+        serializer=OrjsonSerializer(),
+    )
+    app.state.es = es_client
 
     try:
-        # Initialize Elasticsearch client
-        es_url = f"{config.ELASTICSEARCH_PROTOCOL}://{config.ELASTICSEARCH_HOST}:{config.ELASTICSEARCH_PORT}/"
-        logger.info(f"Initializing Elasticsearch client with URL: {es_url}")
-        es_client = Elasticsearch(es_url)
-
         # Test connection
-        if not es_client.ping():
+        if not await es_client.ping():
             raise Exception("Elasticsearch connection failed")
         logger.info("Elasticsearch connection successful")
 
         # Initialize service
-        es_service = ElasticsearchService(es_client, config.ELASTICSEARCH_INDEX)
+        es_service = ElasticsearchService(es_client, settings.elasticsearch_index)
         await es_service.initialize_index()
 
         # Set the service in dependencies (this is the proper way)
         dependencies.set_es_service(es_service)
 
-        # Load sample data if index is empty
-        search_result = await es_service.search_documents(limit=1)
-        if search_result.total_hits == 0:
-            logger.info("Index is empty, loading sample data...")
-            sample_data = NewsDataLoader.load_sample_data()
-            documents_data = [DocumentCreate(**doc) for doc in sample_data]
-            bulk_result = await es_service.bulk_create_documents(documents_data)
-            logger.info(f"Loaded {bulk_result['success_count']} sample documents")
+        # The service is resolved; let injected endpoints skip the
+        # not-initialized check entirely for the rest of the process
+        app.dependency_overrides[dependencies.get_es_service] = lambda: es_service
 
-        logger.info("Application startup completed successfully")
+        yield
+    finally:
+        # Runs even if a later startup step fails
+        app.dependency_overrides.pop(dependencies.get_es_service, None)
+        await es_client.close()
 
-    except Exception as e:
-        logger.error(f"Error during application startup: {str(e)}")
-        raise
+
+@asynccontextmanager
+async def sample_data_lifespan(app: FastAPI):
+    """Seed the index with sample data when it is empty."""
+    es_service = dependencies.get_es_service()
+
+    if await es_service.count_documents() == 0:
+        logger.info("Index is empty, loading sample data...")
+        sample_data = NewsDataLoader.load_sample_data()
+        documents_data = _DOCUMENT_LIST_ADAPTER.validate_python(sample_data)
+        bulk_result = await es_service.bulk_create_documents(documents_data)
+        logger.info("Loaded %s sample documents", bulk_result['success_count'])
 
     yield
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("Starting application lifespan startup")
+
+    try:
+        async with es_lifespan(app):
+            async with sample_data_lifespan(app):
+                logger.info("Application startup completed successfully")
+                yield
+    except Exception as e:
+        logger.error("Error during application startup: %s", e)
+        raise
+
     logger.info("Application shutdown completed")
 
 
@@ -65,6 +111,7 @@ app = FastAPI(
     title="20 Newsgroups Search API",
     description="A full CRUD API for newsgroup documents with Elasticsearch backend",
     version="2.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -90,8 +137,10 @@ async def health_check():
     try:
         # Get service through proper dependency injection
         service = dependencies.get_es_service()
-        # Simple check - if we can get the service, ES should be connected
-        await service.search_documents(limit=0)
+        # Ping hits the cluster directly; a search would be served from the
+        # in-process result cache and mask an Elasticsearch outage
+        if not await service.es.ping():
+            return {"status": "unhealthy", "elasticsearch": "disconnected"}
         return {"status": "healthy", "elasticsearch": "connected"}
     except Exception as e:
         return {"status": "unhealthy", "elasticsearch": "disconnected", "error": str(e)}
@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DocumentStatus(str, Enum):
@@ -34,7 +34,15 @@ class NewsCategory(str, Enum):
     TALK_RELIGION_MISC = "talk.religion.misc"
 
 
+# Materialized once so hot paths iterate a plain tuple instead of
+# resolving Enum members and their .value attributes each time
+CATEGORY_VALUES = tuple(category.value for category in NewsCategory)
+STATUS_VALUES = tuple(status.value for status in DocumentStatus)
+
+
 class DocumentBase(BaseModel):
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     title: str = Field(..., min_length=1, max_length=500)
     body: str = Field(..., min_length=1)
     category: NewsCategory
@@ -59,12 +67,13 @@ class DocumentUpdate(BaseModel):
 
 
 class DocumentResponse(DocumentBase):
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     created_at: datetime
     updated_at: datetime
-
-    class Config:
-        from_attributes = True
+    # Server-side snippets for the matched body text, present on text searches
+    highlight: Optional[List[str]] = None
 
 
 class SearchResponse(BaseModel):
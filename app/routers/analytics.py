@@ -1,14 +1,60 @@
+import asyncio
 import logging
+import time
+from typing import Dict, Tuple
+
 from fastapi import APIRouter, Depends, HTTPException
 
 from app.dependencies import get_es_service
-from app.models import DocumentStatus, NewsCategory
+from app.models import CATEGORY_VALUES, STATUS_VALUES, NewsCategory
 from app.services.elasticsearch_service import ElasticsearchService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Short-TTL stale-while-revalidate cache for aggregation results.
+# Counts only change on ingest, so dashboard-style polling can be served
+# from memory; stale entries are returned immediately and refreshed in
+# the background.
+_CACHE_TTL_SECONDS = 30.0
+_agg_cache: Dict[str, Tuple[float, Dict[str, int]]] = {}
+
+# In-flight background refreshes by field. Keeping a strong reference
+# stops the event loop from garbage-collecting a running task, and the
+# key lets concurrent requests in the stale window share one refresh
+_refresh_tasks: Dict[str, "asyncio.Task[None]"] = {}
+
+
+async def _refresh_counts(service: ElasticsearchService, field: str) -> Dict[str, int]:
+    counts = await service.aggregate_counts(field)
+    _agg_cache[field] = (time.monotonic(), counts)
+    return counts
+
+
+async def _refresh_counts_quietly(service: ElasticsearchService, field: str) -> None:
+    try:
+        await _refresh_counts(service, field)
+    except Exception as e:
+        logger.warning("Background refresh of %s counts failed: %s", field, e)
+
+
+async def _cached_counts(service: ElasticsearchService, field: str) -> Dict[str, int]:
+    """Return cached aggregation counts, refreshing stale entries in the background"""
+    cached = _agg_cache.get(field)
+    if cached is None:
+        return await _refresh_counts(service, field)
+
+    cached_at, counts = cached
+    if time.monotonic() - cached_at >= _CACHE_TTL_SECONDS and field not in _refresh_tasks:
+        # Serve the stale value and revalidate without blocking the request
+        task = asyncio.get_running_loop().create_task(
+            _refresh_counts_quietly(service, field)
+        )
+        _refresh_tasks[field] = task
+        task.add_done_callback(lambda _task, field=field: _refresh_tasks.pop(field, None))
+    return counts
+
 
 @router.get("/stats")
 async def get_analytics_stats(
@@ -16,11 +62,12 @@ async def get_analytics_stats(
 ):
     """Get basic analytics about the document collection"""
     try:
-        # Total documents
-        total_docs = await service.search_documents(limit=0)
+        # One terms aggregation per field instead of one query per value
+        total_documents = await service.count_documents()
+        categories = await _cached_counts(service, "category")
+        statuses = await _cached_counts(service, "status")
 
-        # Documents by category (sample a few key categories)
-        categories = {}
+        # Sample a few key categories for the overview
         sample_categories = [
             NewsCategory.SCI_SPACE,
             NewsCategory.COMP_GRAPHICS,
@@ -29,24 +76,20 @@ async def get_analytics_stats(
             NewsCategory.SCI_MED
         ]
 
-        for category in sample_categories:
-            cat_result = await service.search_documents(category=category.value, limit=0)
-            categories[category.value] = cat_result.total_hits
-
-        # Documents by status
-        statuses = {}
-        for status in DocumentStatus:
-            status_result = await service.search_documents(status=status.value, limit=0)
-            statuses[status.value] = status_result.total_hits
-
         return {
-            "total_documents": total_docs.total_hits,
-            "sample_categories": categories,
-            "statuses": statuses,
+            "total_documents": total_documents,
+            "sample_categories": {
+                category.value: categories.get(category.value, 0)
+                for category in sample_categories
+            },
+            "statuses": {
+                status: statuses.get(status, 0)
+                for status in STATUS_VALUES
+            },
             "note": "sample_categories shows only a subset of all available categories"
         }
     except Exception as e:
-        logger.error(f"Failed to get analytics: {e}")
+        logger.error("Failed to get analytics: %s", e)
         raise HTTPException(status_code=500, detail=f"Analytics failed: {str(e)}")
 
 
@@ -56,15 +99,18 @@ async def get_category_breakdown(
 ):
     """Get document count for all categories"""
     try:
-        categories = {}
-        for category in NewsCategory:
-            cat_result = await service.search_documents(category=category.value, limit=0)
-            categories[category.value] = cat_result.total_hits
+        counts = await _cached_counts(service, "category")
+
+        # The aggregation omits empty categories; keep them in the response
+        categories = {
+            category: counts.get(category, 0)
+            for category in CATEGORY_VALUES
+        }
 
         return {
             "categories": categories,
             "total_categories": len([c for c in categories.values() if c > 0])
         }
     except Exception as e:
-        logger.error(f"Failed to get category breakdown: {e}")
+        logger.error("Failed to get category breakdown: %s", e)
         raise HTTPException(status_code=500, detail=f"Category breakdown failed: {str(e)}")
\ No newline at end of file
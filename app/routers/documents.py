@@ -23,10 +23,10 @@ async def create_document(
     """Create a new document"""
     try:
         result = await service.create_document(document)
-        logger.info(f"Created document with ID: {result.id}")
+        logger.info("Created document with ID: %s", result.id)
         return result
     except Exception as e:
-        logger.error(f"Failed to create document: {e}")
+        logger.error("Failed to create document: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to create document: {str(e)}")
 
 @router.get("/{doc_id}", response_model=DocumentResponse)
@@ -43,7 +43,7 @@ async def get_document(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get document {doc_id}: {e}")
+        logger.error("Failed to get document %s: %s", doc_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to retrieve document: {str(e)}")
 
 @router.put("/{doc_id}", response_model=DocumentResponse)
@@ -57,12 +57,12 @@ async def update_document(
         result = await service.update_document(doc_id, update_data)
         if not result:
             raise HTTPException(status_code=404, detail="Document not found")
-        logger.info(f"Updated document with ID: {doc_id}")
+        logger.info("Updated document with ID: %s", doc_id)
         return result
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to update document {doc_id}: {e}")
+        logger.error("Failed to update document %s: %s", doc_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to update document: {str(e)}")
 
 @router.delete("/{doc_id}")
@@ -75,12 +75,12 @@ async def delete_document(
         result = await service.delete_document(doc_id)
         if not result:
             raise HTTPException(status_code=404, detail="Document not found")
-        logger.info(f"Deleted document with ID: {doc_id}")
+        logger.info("Deleted document with ID: %s", doc_id)
         return {"message": f"Document {doc_id} deleted successfully"}
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete document {doc_id}: {e}")
+        logger.error("Failed to delete document %s: %s", doc_id, e)
         raise HTTPException(status_code=500, detail=f"Failed to delete document: {str(e)}")
 
 @router.post("/bulk", response_model=BulkOperationResponse)
@@ -94,8 +94,8 @@ async def bulk_create_documents(
 
     try:
         result = await service.bulk_create_documents(documents)
-        logger.info(f"Bulk create completed: {result['success_count']} successful, {result['error_count']} failed")
+        logger.info("Bulk create completed: %s successful, %s failed", result['success_count'], result['error_count'])
         return BulkOperationResponse(**result)
     except Exception as e:
-        logger.error(f"Bulk create failed: {e}")
+        logger.error("Bulk create failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Bulk create failed: {str(e)}")
\ No newline at end of file
@@ -3,7 +3,8 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from app.dependencies import get_es_service
-from app.models import DocumentStatus, NewsCategory, SearchResponse
+from app.models import (CATEGORY_VALUES, DocumentStatus, NewsCategory,
+                        SearchResponse)
 from app.services.elasticsearch_service import ElasticsearchService
 
 logger = logging.getLogger(__name__)
@@ -32,16 +33,21 @@ async def search_documents(
             limit=limit,
             offset=offset
         )
-        logger.info(f"Search completed: {result.total_hits} results found")
+        logger.info("Search completed: %s results found", result.total_hits)
         return result
     except Exception as e:
-        logger.error(f"Search failed: {e}")
+        logger.error("Search failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
+# The category list never changes during the process lifetime, so the
+# whole response is built once at import
+_CATEGORIES_RESPONSE = {
+    "categories": list(CATEGORY_VALUES),
+    "total_categories": len(CATEGORY_VALUES)
+}
+
+
 @router.get("/categories")
 async def list_categories():
     """List all available newsgroup categories"""
-    return {
-        "categories": [category.value for category in NewsCategory],
-        "total_categories": len(NewsCategory)
-    }
\ No newline at end of file
+    return _CATEGORIES_RESPONSE
\ No newline at end of file
@@ -1,83 +1,144 @@
 # services/data_loader.py
+import hashlib
 import logging
+import os
+import pickle
 import re
-from typing import Any, Dict, List, Optional
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(slots=True)
+class NewsDoc:
+    """One cleaned newsgroup post; slots keep the per-document footprint
+    well under a plain dict's"""
+    title: str
+    body: str
+    category: str
+    author: str
+    tags: List[str]
+    status: str = 'active'
+
 # Pre-compile regex patterns for efficiency
 RE_SUBJECT_PREFIX = re.compile(r'^(Re:\s*)+', re.IGNORECASE)
 RE_EMAIL_EXTRACT = re.compile(r'<(.+?)>')
-RE_EXCESSIVE_WHITESPACE = re.compile(r'\s+')
-
-# Email headers to skip (as a set for O(1) lookup)
-EMAIL_HEADERS = {
+# Captures Subject/From values across the whole message in one scan
+RE_HEADER_LINE = re.compile(
+    r'^(?:Subject:[ \t]*(?P<subject>.*)|From:[ \t]*(?P<author>.*))$',
+    re.MULTILINE
+)
+
+
+def _clean_subject(value: str) -> Optional[str]:
+    """Normalize a raw Subject value ("Re:" prefixes stripped, capped length)"""
+    value = RE_SUBJECT_PREFIX.sub('', value)
+    return value[:500] if value else None
+
+
+def _clean_author(value: str) -> Optional[str]:
+    """Normalize a raw From value to a display name or mailbox local part"""
+    if '<' in value and '>' in value:
+        # Extract name before email
+        name_part = value.split('<')[0].strip()
+        if name_part:
+            return name_part
+        # Fallback to email
+        email_match = RE_EMAIL_EXTRACT.search(value)
+        if email_match:
+            return email_match.group(1).split('@')[0]
+        return None
+    # Just return the author as is, but limit to the local part
+    return value.split('@')[0] if '@' in value else value
+
+# Email header prefixes to skip; str.startswith accepts a tuple and tests
+# all prefixes in a single C call. Extension headers ('X-Mailer:', ...)
+# are handled separately: they additionally need a colon near the start
+# so prose like "X-ray results were fine" survives in bodies
+EMAIL_HEADER_PREFIXES = (
     'From:', 'Subject:', 'Date:', 'Organization:', 'Lines:',
     'Message-ID:', 'NNTP-Posting-Host:', 'Reply-To:', 'Newsgroups:'
+)
+
+# First characters of the skippable headers ('X' for the extension
+# headers); most body lines fail this one set lookup and never reach the
+# full prefix tests
+_HEADER_FIRST_CHARS = frozenset(prefix[0] for prefix in EMAIL_HEADER_PREFIXES) | {'X'}
+
+# Keyed on the first newsgroup name segment for a single hash lookup
+CATEGORY_TAGS = {
+    'comp': 'computer',
+    'rec': 'recreation',
+    'sci': 'science',
+    'talk': 'discussion',
+    'soc': 'society',
+    'misc': 'misc',
+    'alt': 'alternative'
 }
 
+# Processed-corpus cache: fetching and cleaning 20newsgroups is expensive,
+# but the output is deterministic per parameter set, so results are memoized
+# in-process and persisted to disk across restarts
+_CACHE_DIR = Path(os.environ.get(
+    'NEWSGROUPS_CACHE_DIR',
+    Path.home() / '.cache' / 'newsgroups_loader'
+))
+_document_cache: Dict[tuple, List[Dict[str, Any]]] = {}
 
-class NewsDataLoader:
-    """Load real news data from 20newsgroups dataset"""
 
-    @staticmethod
-    def _parse_email_headers(text: str) -> Dict[str, Optional[str]]:
-        """Extract common headers from email text in one pass"""
-        lines = text.split('\n')
-        headers: Dict[str, Optional[str]] = {'subject': None, 'author': None}
+def _cache_file(cache_key: tuple) -> Path:
+    digest = hashlib.sha1(repr(cache_key).encode()).hexdigest()
+    return _CACHE_DIR / f'{digest}.pkl'
 
-        for line in lines:
-            line_stripped = line.strip()
-            if not line_stripped or ':' not in line_stripped:
-                continue
 
-            if line.startswith('Subject:'):
-                subject = line[8:].strip()  # len('Subject:') = 8
-                if subject:
-                    # Remove "Re:" prefixes
-                    subject = RE_SUBJECT_PREFIX.sub('', subject)
-                    headers['subject'] = subject[:500] if subject else None
-
-            elif line.startswith('From:'):
-                author = line[5:].strip()  # len('From:') = 5
-                if author:
-                    # Extract name or email
-                    if '<' in author and '>' in author:
-                        # Extract name before email
-                        name_part = author.split('<')[0].strip()
-                        if name_part:
-                            headers['author'] = name_part
-                        else:
-                            # Fallback to email
-                            email_match = RE_EMAIL_EXTRACT.search(author)
-                            if email_match:
-                                headers['author'] = email_match.group(1).split('@')[0]
-                    else:
-                        # Just return the author as is, but limit length
-                        headers['author'] = author.split('@')[0] if '@' in author else author
+# Lazily-imported 20newsgroups fetcher; sklearn (with numpy/scipy) is only
+# pulled in when data loading is actually requested, not at app startup
+_fetch_20newsgroups = None
 
-        return headers
+
+def _get_fetcher():
+    """Import sklearn's 20newsgroups fetcher on first use and cache it"""
+    global _fetch_20newsgroups
+    if _fetch_20newsgroups is None:
+        from sklearn.datasets import fetch_20newsgroups
+        _fetch_20newsgroups = fetch_20newsgroups
+    return _fetch_20newsgroups
+
+
+class NewsDataLoader:
+    """Load real news data from 20newsgroups dataset"""
 
     @staticmethod
-    def clean_text(text: str) -> str:
-        """Clean and process text content efficiently"""
+    def parse_document(text: str) -> Tuple[Optional[str], Optional[str], str]:
+        """Extract (subject, author, cleaned body) in a single pass over the lines"""
         if not text:
-            return ""
+            return None, None, ""
 
-        lines = text.split('\n')
-        cleaned_lines = []
+        subject: Optional[str] = None
+        author: Optional[str] = None
+        cleaned_lines: List[str] = []
         skip_quoted = False
 
-        for line in lines:
+        for line in text.split('\n'):
             stripped_line = line.strip()  # Call strip() only once per line
 
-            # Skip email headers using set lookup (O(1))
-            header_found = False
-            for header in EMAIL_HEADERS:
-                if line.startswith(header) or (stripped_line.startswith('X-') and ':' in stripped_line):
-                    header_found = True
-                    break
-            if header_found:
+            # Skip email headers with one tuple startswith, recording the
+            # interesting ones as we pass them; the first-char set lookup
+            # lets typical body lines bail out immediately
+            if line[:1] in _HEADER_FIRST_CHARS and (
+                line.startswith(EMAIL_HEADER_PREFIXES)
+                or (line.startswith('X-') and ':' in line[:20])
+            ):
+                if line.startswith('Subject:'):
+                    value = line[8:].strip()  # len('Subject:') = 8
+                    if value:
+                        subject = _clean_subject(value)
+                elif line.startswith('From:'):
+                    value = line[5:].strip()  # len('From:') = 5
+                    if value:
+                        author = _clean_author(value) or author
                 continue
 
             # Handle quoted text
@@ -88,58 +149,70 @@ class NewsDataLoader:
                 skip_quoted = False
 
             if not skip_quoted and stripped_line:
-                # Remove excessive whitespace in one regex call
-                cleaned_line = RE_EXCESSIVE_WHITESPACE.sub(' ', stripped_line)
-                cleaned_lines.append(cleaned_line)
+                # Collapse whitespace entirely in C, no regex engine
+                cleaned_lines.append(' '.join(stripped_line.split()))
+
+        return subject, author, '\n'.join(cleaned_lines)
+
+    @staticmethod
+    def _parse_email_headers(text: str) -> Dict[str, Optional[str]]:
+        """Extract common headers with one multiline regex scan"""
+        headers: Dict[str, Optional[str]] = {'subject': None, 'author': None}
 
-        return '\n'.join(cleaned_lines)
+        for match in RE_HEADER_LINE.finditer(text):
+            subject_value = match.group('subject')
+            if subject_value is not None:
+                subject_value = subject_value.strip()
+                if subject_value:
+                    headers['subject'] = _clean_subject(subject_value)
+            else:
+                author_value = match.group('author').strip()
+                if author_value:
+                    headers['author'] = _clean_author(author_value) or headers['author']
+
+        return headers
+
+    @staticmethod
+    def clean_text(text: str) -> str:
+        """Clean and process text content"""
+        return NewsDataLoader.parse_document(text)[2]
 
     @staticmethod
     def extract_subject_from_text(text: str) -> Optional[str]:
         """Extract subject line from email text"""
-        headers = NewsDataLoader._parse_email_headers(text)
-        return headers['subject']
+        return NewsDataLoader._parse_email_headers(text)['subject']
 
     @staticmethod
     def extract_author_from_text(text: str) -> Optional[str]:
         """Extract author from email text"""
-        headers = NewsDataLoader._parse_email_headers(text)
-        return headers['author']
+        return NewsDataLoader._parse_email_headers(text)['author']
 
     @staticmethod
     def _generate_tags(category: str) -> List[str]:
         """Generate tags based on category efficiently"""
         tags = [category.replace('.', '-')]
 
-        # Use dictionary for O(1) lookup instead of multiple if-elif
-        category_mappings = {
-            'comp.': 'computer',
-            'rec.': 'recreation',
-            'sci.': 'science',
-            'talk.': 'discussion',
-            'soc.': 'society',
-            'misc.': 'misc',
-            'alt.': 'alternative'
-        }
-
-        for prefix, tag in category_mappings.items():
-            if category.startswith(prefix):
-                tags.append(tag)
-                break
+        # Single dict lookup on the first segment, no prefix scanning
+        extra = CATEGORY_TAGS.get(category.split('.', 1)[0])
+        if extra:
+            tags.append(extra)
 
         return tags
 
     @staticmethod
-    def load_20newsgroups_data(
+    def iter_20newsgroups_documents(
             subset: str = 'train',
             categories: Optional[List[str]] = None,
             max_documents: int = 1000,
             remove_headers: bool = True,
             remove_footers: bool = True,
             remove_quotes: bool = True
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[NewsDoc]:
         """
-        Load data from 20newsgroups dataset with improved efficiency
+        Stream cleaned documents from the 20newsgroups dataset one at a time
+
+        Memory stays O(1) in the number of documents, so the iterator can be
+        fed directly into a streaming bulk indexer.
 
         Args:
             subset: 'train', 'test', or 'all'
@@ -150,9 +223,9 @@ class NewsDataLoader:
             remove_quotes: Remove quoted text
         """
         try:
-            from sklearn.datasets import fetch_20newsgroups
+            fetch_20newsgroups = _get_fetcher()
 
-            logger.info(f"Loading 20newsgroups dataset (subset: {subset}, max_docs: {max_documents})")
+            logger.info("Loading 20newsgroups dataset (subset: %s, max_docs: %s)", subset, max_documents)
 
             # Configure removal parameters
             remove = []
@@ -171,65 +244,126 @@ class NewsDataLoader:
                 shuffle=True,
                 random_state=42
             )
+        except ImportError:
+            logger.error(
+                "scikit-learn is required to load 20newsgroups dataset. Install with: pip install scikit-learn"
+            )
+            return
+        except Exception as e:
+            logger.error("Failed to load 20newsgroups data: %s", e)
+            return
 
-            documents = []
-            category_names = newsgroups.target_names
+        yielded = 0
+        category_names = newsgroups.target_names
 
-            # Process documents with enumerate limit for efficiency
-            for i, (text, target) in enumerate(zip(newsgroups.data, newsgroups.target)):
-                if i >= max_documents:
-                    break
+        # ~20 fixed categories: build each tag list once, not per document
+        tag_cache = {name: NewsDataLoader._generate_tags(name) for name in category_names}
 
-                if not text or len(text.strip()) < 50:  # Skip empty or very short texts
-                    continue
+        # Process documents with enumerate limit for efficiency
+        for i, (text, target) in enumerate(zip(newsgroups.data, newsgroups.target)):
+            if i >= max_documents:
+                break
 
-                category = category_names[target]
+            # Cheap O(1) length check; .strip() would copy the whole text
+            # just to reject the rare tiny message (60 leaves headroom for
+            # surrounding whitespace over the old 50-char stripped bound)
+            if not text or len(text) < 60:
+                continue
 
-                # Clean text
-                cleaned_text = NewsDataLoader.clean_text(text)
-                if len(cleaned_text) < 50:
-                    continue
+            category = category_names[target]
 
-                # Extract headers in one pass
-                headers = NewsDataLoader._parse_email_headers(newsgroups.data[i])
+            # Clean text and extract headers in one pass
+            subject, author, cleaned_text = NewsDataLoader.parse_document(text)
+            if len(cleaned_text) < 50:
+                continue
 
-                # Use extracted subject or create fallback title
-                title = headers['subject']
+            # Use extracted subject or create fallback title
+            title = subject
+            if not title:
+                # Use first line as title if no subject found
+                first_lines = cleaned_text.split('\n')[:2]
+                title = ' '.join(first_lines)[:200]
                 if not title:
-                    # Use first line as title if no subject found
-                    first_lines = cleaned_text.split('\n')[:2]
-                    title = ' '.join(first_lines)[:200]
-                    if not title:
-                        title = f"Post from {category}"
-
-                # Use extracted author or default
-                author = headers['author'] or "Anonymous"
+                    title = f"Post from {category}"
 
-                # Generate tags efficiently
-                tags = NewsDataLoader._generate_tags(category)
+            # Use extracted author or default
+            author = author or "Anonymous"
 
-                doc_data = {
-                    'title': title,
-                    'body': cleaned_text,
-                    'category': category,
-                    'author': author,
-                    'tags': tags,
-                    'status': 'active'
-                }
+            yield NewsDoc(
+                title=title,
+                body=cleaned_text,
+                category=category,
+                author=author,
+                tags=tag_cache[category]
+            )
+            yielded += 1
 
-                documents.append(doc_data)
+        logger.info("Successfully loaded %s documents from 20newsgroups", yielded)
 
-            logger.info(f"Successfully loaded {len(documents)} documents from 20newsgroups")
-            return documents
+    @staticmethod
+    def load_20newsgroups_data(
+            subset: str = 'train',
+            categories: Optional[List[str]] = None,
+            max_documents: int = 1000,
+            remove_headers: bool = True,
+            remove_footers: bool = True,
+            remove_quotes: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Load 20newsgroups documents as a (cached) list
 
-        except ImportError:
-            logger.error(
-                "scikit-learn is required to load 20newsgroups dataset. Install with: pip install scikit-learn"
-            )
-            return []
+        List-materializing wrapper around iter_20newsgroups_documents for
+        callers that need the whole batch; results are memoized in-process
+        and persisted to disk.
+        """
+        cache_key = (
+            subset,
+            tuple(sorted(categories)) if categories else None,
+            max_documents,
+            remove_headers,
+            remove_footers,
+            remove_quotes
+        )
+
+        # In-process hit: constant time
+        cached = _document_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Disk hit: skip sklearn fetch and re-cleaning across restarts
+        cache_file = _cache_file(cache_key)
+        try:
+            if cache_file.exists():
+                with cache_file.open('rb') as f:
+                    documents = pickle.load(f)
+                logger.info("Loaded %s documents from cache %s", len(documents), cache_file)
+                _document_cache[cache_key] = documents
+                return documents
         except Exception as e:
-            logger.error(f"Failed to load 20newsgroups data: {e}")
-            return []
+            logger.warning("Ignoring unreadable cache file %s: %s", cache_file, e)
+
+        # Dicts here, not NewsDoc: the pickle cache and existing callers
+        # expect plain mappings
+        documents = [asdict(doc) for doc in NewsDataLoader.iter_20newsgroups_documents(
+            subset=subset,
+            categories=categories,
+            max_documents=max_documents,
+            remove_headers=remove_headers,
+            remove_footers=remove_footers,
+            remove_quotes=remove_quotes
+        )]
+
+        # Failed loads come back empty; don't cache those
+        if documents:
+            _document_cache[cache_key] = documents
+            try:
+                _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                with cache_file.open('wb') as f:
+                    pickle.dump(documents, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except OSError as e:
+                logger.warning("Could not write cache file %s: %s", cache_file, e)
+
+        return documents
 
     @staticmethod
     def load_sample_data() -> List[Dict[str, Any]]:
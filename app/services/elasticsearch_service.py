@@ -1,10 +1,12 @@
 # services/elasticsearch_service.py
 import logging
+import time
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch
+from elasticsearch.helpers import async_streaming_bulk
 from elasticsearch.exceptions import NotFoundError
 
 from app.models import (DocumentCreate, DocumentResponse, DocumentUpdate,
@@ -12,10 +14,37 @@ from app.models import (DocumentCreate, DocumentResponse, DocumentUpdate,
 
 logger = logging.getLogger(__name__)
 
+# Constant query fragments built once instead of per request
+_MATCH_ALL = {'match_all': {}}
+_SEARCH_FIELDS = ['title^2', 'body']
+_SORT_NEWEST_FIRST = [{'created_at': {'order': 'desc'}}, {'_doc': 'asc'}]
+
+# Identical searches (dashboards, pagination) are served from memory for
+# a short window; any write bumps the index version, which is part of the
+# cache key, so stale results are never returned after a mutation
+_SEARCH_CACHE_TTL = 60.0
+_SEARCH_CACHE_MAX_ENTRIES = 256
+_BODY_HIGHLIGHT = {
+    'fields': {
+        'body': {
+            'fragment_size': 200,
+            'number_of_fragments': 1,
+            'no_match_size': 200
+        }
+    }
+}
+
 class ElasticsearchService:
-    def __init__(self, es: Elasticsearch, index_name: str):
+    def __init__(self, es: AsyncElasticsearch, index_name: str):
         self.es = es
         self.index_name = index_name
+        self._search_cache: Dict[tuple, Any] = {}
+        self._index_version = 0
+
+    def _invalidate_search_cache(self) -> None:
+        """Called after any write; retires all cached search results"""
+        self._index_version += 1
+        self._search_cache.clear()
         
     def _create_document_mapping(self) -> Dict[str, Any]:
         """Create optimized mapping for document storage and search"""
@@ -61,93 +90,109 @@ class ElasticsearchService:
     async def initialize_index(self) -> None:
         """Initialize the Elasticsearch index with proper mapping"""
         try:
-            if not self.es.indices.exists(index=self.index_name):
-                logger.info(f"Creating index {self.index_name}")
-                self.es.indices.create(
+            if not await self.es.indices.exists(index=self.index_name):
+                logger.info("Creating index %s", self.index_name)
+                await self.es.indices.create(
                     index=self.index_name,
                     mappings=self._create_document_mapping()
                 )
-                logger.info(f"Index {self.index_name} created successfully")
+                logger.info("Index %s created successfully", self.index_name)
             else:
-                logger.info(f"Index {self.index_name} already exists")
+                logger.info("Index %s already exists", self.index_name)
         except Exception as e:
-            logger.error(f"Failed to initialize index: {e}")
+            logger.error("Failed to initialize index: %s", e)
             raise
     
     async def create_document(self, document: DocumentCreate) -> DocumentResponse:
         """Create a new document"""
-        doc_id = str(uuid.uuid4())
+        # .hex skips the dash-formatting pass of str(uuid4())
+        doc_id = uuid.uuid4().hex
         now = datetime.utcnow()
         
-        doc_data = document.dict()
+        doc_data = document.model_dump()
         doc_data.update({
             'created_at': now,
             'updated_at': now
         })
         
         try:
-            self.es.index(
+            # wait_for piggybacks on the next scheduled refresh instead
+            # of forcing an immediate segment flush
+            await self.es.index(
                 index=self.index_name,
                 id=doc_id,
-                body=doc_data
+                body=doc_data,
+                refresh='wait_for'
             )
-            self.es.indices.refresh(index=self.index_name)
-            
+            self._invalidate_search_cache()
+
             return DocumentResponse(id=doc_id, **doc_data)
         except Exception as e:
-            logger.error(f"Failed to create document: {e}")
+            logger.error("Failed to create document: %s", e)
             raise
     
     async def get_document(self, doc_id: str) -> Optional[DocumentResponse]:
         """Get a document by ID"""
         try:
-            result = self.es.get(index=self.index_name, id=doc_id)
+            result = await self.es.get(index=self.index_name, id=doc_id)
             source = result['_source']
             return DocumentResponse(id=doc_id, **source)
         except NotFoundError:
             return None
         except Exception as e:
-            logger.error(f"Failed to get document {doc_id}: {e}")
+            logger.error("Failed to get document %s: %s", doc_id, e)
             raise
     
     async def update_document(self, doc_id: str, update_data: DocumentUpdate) -> Optional[DocumentResponse]:
         """Update a document"""
+        update_dict = {k: v for k, v in update_data.model_dump().items() if v is not None}
+        update_dict['updated_at'] = datetime.utcnow()
+
         try:
-            # First check if document exists
-            existing = await self.get_document(doc_id)
-            if not existing:
-                return None
-            
-            # Prepare update data
-            update_dict = {k: v for k, v in update_data.dict().items() if v is not None}
-            update_dict['updated_at'] = datetime.utcnow()
-            
-            self.es.update(
+            # Single round-trip: the update reports a missing document via
+            # NotFoundError, and source=True returns the merged document so
+            # no follow-up get is needed
+            result = await self.es.update(
                 index=self.index_name,
                 id=doc_id,
-                body={'doc': update_dict}
+                body={'doc': update_dict, '_source': True},
+                retry_on_conflict=3,
+                refresh='wait_for'
             )
-            self.es.indices.refresh(index=self.index_name)
-            
-            return await self.get_document(doc_id)
+            self._invalidate_search_cache()
+
+            return DocumentResponse(id=doc_id, **result['get']['_source'])
         except NotFoundError:
             return None
         except Exception as e:
-            logger.error(f"Failed to update document {doc_id}: {e}")
+            logger.error("Failed to update document %s: %s", doc_id, e)
             raise
     
     async def delete_document(self, doc_id: str) -> bool:
         """Delete a document"""
         try:
-            self.es.delete(index=self.index_name, id=doc_id)
-            self.es.indices.refresh(index=self.index_name)
+            await self.es.delete(
+                index=self.index_name,
+                id=doc_id,
+                refresh='wait_for'
+            )
+            self._invalidate_search_cache()
             return True
         except NotFoundError:
             return False
         except Exception as e:
-            logger.error(f"Failed to delete document {doc_id}: {e}")
+            logger.error("Failed to delete document %s: %s", doc_id, e)
             raise
     
+    async def count_documents(self) -> int:
+        """Count documents in the index without running a search"""
+        try:
+            result = await self.es.count(index=self.index_name)
+            return result['count']
+        except Exception as e:
+            logger.error("Failed to count documents: %s", e)
+            raise
+
     async def search_documents(
         self,
         query: Optional[str] = None,
@@ -159,91 +204,169 @@ class ElasticsearchService:
         offset: int = 0
     ) -> SearchResponse:
         """Advanced search with multiple filters"""
+        cache_key = (
+            self._index_version,
+            query,
+            category,
+            tuple(sorted(tags)) if tags else None,
+            author,
+            status,
+            limit,
+            offset
+        )
+        cached = self._search_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _SEARCH_CACHE_TTL:
+            return cached[1]
+
         search_body = {
-            'query': {'bool': {'must': [], 'filter': []}},
             'from': offset,
             'size': limit,
-            'sort': [{'created_at': {'order': 'desc'}}]
+            'track_total_hits': 10000
         }
-        
-        # Text search
-        if query:
-            search_body['query']['bool']['must'].append({
-                'multi_match': {
-                    'query': query,
-                    'fields': ['title^2', 'body'],
-                    'type': 'best_fields'
-                }
-            })
-        else:
-            search_body['query']['bool']['must'].append({'match_all': {}})
-        
-        # Filters
+
+        # Filters run in filter context: no scoring, cacheable bitsets
+        filters = []
         if category:
-            search_body['query']['bool']['filter'].append({'term': {'category': category}})
-        
+            filters.append({'term': {'category': category}})
+
         if tags:
-            search_body['query']['bool']['filter'].append({'terms': {'tags': tags}})
-        
+            filters.append({'terms': {'tags': tags}})
+
         if author:
-            search_body['query']['bool']['filter'].append({'term': {'author': author}})
-        
+            filters.append({'term': {'author': author}})
+
         if status:
-            search_body['query']['bool']['filter'].append({'term': {'status': status}})
+            filters.append({'term': {'status': status}})
+
+        if query:
+            # Text search: let BM25 drive the ordering
+            search_body['query'] = {
+                'bool': {
+                    'must': [{
+                        'multi_match': {
+                            'query': query,
+                            'fields': _SEARCH_FIELDS,
+                            'type': 'best_fields'
+                        }
+                    }],
+                    'filter': filters
+                }
+            }
+            # Let Elasticsearch build the preview snippet instead of
+            # slicing full bodies in Python
+            search_body['highlight'] = _BODY_HIGHLIGHT
+        else:
+            # Filter-only: constant_score skips scoring entirely;
+            # page by recency with a stable _doc tiebreak
+            if filters:
+                search_body['query'] = {
+                    'constant_score': {'filter': {'bool': {'filter': filters}}}
+                }
+            else:
+                search_body['query'] = _MATCH_ALL
+            search_body['sort'] = _SORT_NEWEST_FIRST
         
         try:
-            result = self.es.search(index=self.index_name, body=search_body)
+            result = await self.es.search(index=self.index_name, body=search_body)
             
+            # Hits come straight from our own index, so re-running field
+            # validation per document is wasted work; model_construct just
+            # assigns. FastAPI still validates the response model on the
+            # way out of the endpoint.
             documents = [
-                DocumentResponse(id=hit['_id'], **hit['_source'])
+                DocumentResponse.model_construct(
+                    id=hit['_id'],
+                    highlight=hit.get('highlight', {}).get('body'),
+                    **hit['_source']
+                )
                 for hit in result['hits']['hits']
             ]
             
-            return SearchResponse(
+            response = SearchResponse(
                 total_hits=result['hits']['total']['value'],
                 max_score=result['hits']['max_score'],
                 took_ms=result['took'],
                 documents=documents
             )
+
+            if len(self._search_cache) >= _SEARCH_CACHE_MAX_ENTRIES:
+                # Evict the oldest insertion to bound memory
+                self._search_cache.pop(next(iter(self._search_cache)))
+            self._search_cache[cache_key] = (time.monotonic(), response)
+
+            return response
         except Exception as e:
-            logger.error(f"Search failed: {e}")
+            logger.error("Search failed: %s", e)
             raise
     
-    async def bulk_create_documents(self, documents: List[DocumentCreate]) -> Dict[str, Any]:
-        """Bulk create documents"""
-        actions = []
+    async def aggregate_counts(self, field: str) -> Dict[str, int]:
+        """Get document counts grouped by a keyword field in a single query"""
+        try:
+            result = await self.es.search(
+                index=self.index_name,
+                body={
+                    'size': 0,
+                    'aggs': {
+                        'by_field': {
+                            'terms': {'field': field, 'size': 50}
+                        }
+                    }
+                }
+            )
+            buckets = result['aggregations']['by_field']['buckets']
+            return {bucket['key']: bucket['doc_count'] for bucket in buckets}
+        except Exception as e:
+            logger.error("Aggregation on %s failed: %s", field, e)
+            raise
+
+    async def bulk_create_documents(self, documents: Iterable[DocumentCreate]) -> Dict[str, Any]:
+        """Bulk create documents, streaming actions in fixed-size chunks"""
         now = datetime.utcnow()
-        
-        for doc in documents:
-            doc_id = str(uuid.uuid4())
-            doc_data = doc.dict()
-            doc_data.update({
-                'created_at': now,
-                'updated_at': now
-            })
-            
-            actions.extend([
-                {'index': {'_index': self.index_name, '_id': doc_id}},
-                doc_data
-            ])
-        
+
+        def actions():
+            for doc in documents:
+                doc_data = doc.model_dump()
+                doc_data.update({
+                    'created_at': now,
+                    'updated_at': now
+                })
+                # No _id: Elasticsearch auto-generates Flake IDs, which
+                # skips the client-side UUID work and the server-side
+                # put-if-absent version lookup
+                yield {
+                    '_index': self.index_name,
+                    '_source': doc_data
+                }
+
+        success_count = 0
+        errors: List[str] = []
+
         try:
-            result = self.es.bulk(body=actions)
-            self.es.indices.refresh(index=self.index_name)
-            
-            success_count = sum(1 for item in result['items'] if 'error' not in item.get('index', {}))
-            error_count = len(result['items']) - success_count
-            errors = [
-                str(item.get('index', {}).get('error', ''))
-                for item in result['items']
-                if 'error' in item.get('index', {})
-            ]
-            
+            # Streaming keeps memory at O(chunk_size) and overlaps action
+            # generation with the network round-trips. The longer timeout
+            # goes on an options() view of the client; as an API kwarg it
+            # only works through a deprecated compat shim
+            async for ok, item in async_streaming_bulk(
+                self.es.options(request_timeout=60),
+                actions(),
+                chunk_size=500,
+                max_chunk_bytes=10 * 1024 * 1024,
+                raise_on_error=False
+            ):
+                if ok:
+                    success_count += 1
+                else:
+                    errors.append(str(item))
+
+            # One refresh for the whole load instead of per chunk
+            await self.es.indices.refresh(index=self.index_name)
+            self._invalidate_search_cache()
+
             return {
                 'success_count': success_count,
-                'error_count': error_count,
+                'error_count': len(errors),
                 'errors': errors
             }
         except Exception as e:
-            logger.error(f"Bulk create failed: {e}")
+            logger.error("Bulk create failed: %s", e)
             raise
\ No newline at end of file